@@ -91,8 +91,10 @@ auto log_event = [](const auto& event) {
 };
 
 auto place_order = [](const PriceUpdate& update) {
-    LOG_ACTION("Placing order for {} at ${:.2f}", update.symbol, update.price);
-    std::cout << "Placing order for " << update.symbol << " at $" << update.price << std::endl;
+    // Format once and reuse the text for both the log and the console
+    const auto line = fmt::format("Placing order for {} at ${:.2f}", update.symbol, update.price);
+    LOG_ACTION("{}", line);
+    std::cout << line << '\n';
 };
 
 // State machine definition
@@ -151,7 +153,7 @@ protected:
 
 int main() {
     // Initialize logging
-    event_adapter::Logger::initialize("trading_system_proper", spdlog::level::debug, true, "trading_system_proper.log");
+    event_adapter::Logger::initialize("trading_system_proper", spdlog::level::debug, true, "trading_system_proper.log", true);
     EVENT_LOG_INFO("=== Trading System Starting (Proper Event Adapter) ===");
     
     // Create state machine
@@ -163,17 +165,30 @@ int main() {
     
     // Configure event dispatcher
     auto& dispatcher = system.dispatcher();
+    // Shed price ticks rather than fall unboundedly behind; session and order
+    // messages are always queued so the state machine never misses them
+    dispatcher.set_max_queue_size(10000, [](const event_adapter::EventPtr& event) {
+        auto market = std::dynamic_pointer_cast<event_adapter::TypedEvent<MarketDataEvent>>(event);
+        if (!market) {
+            return false;
+        }
+        const auto& data = market->data().data;
+        auto type_it = data.find("type");
+        return type_it != data.end() && *type_it == "price_update";
+    });
     
     // Register event processor for MarketDataEvent that transforms and dispatches appropriate events
     dispatcher.template register_event_processor<MarketDataEvent>(
         [](const MarketDataEvent& event, decltype(trading_sm)& sm) {
             const auto& data = event.data;
-            if (!data.contains("type")) {
+            // Single lookup, and bind the type by reference instead of copying it out
+            auto type_it = data.find("type");
+            if (type_it == data.end() || !type_it->is_string()) {
                 EVENT_LOG_WARN("Market data missing 'type' field");
                 return;
             }
             
-            std::string type = data["type"];
+            const auto& type = type_it->get_ref<const std::string&>();
             EVENT_LOG_DEBUG("Processing market data type: {}", type);
             
             // Convert string to enum for switch statement
@@ -189,8 +204,8 @@ int main() {
                     break;
                     
                 case EventType::PRICE_UPDATE: {
-                    double price = data["price"].get<double>();
-                    std::string symbol = data["symbol"].get<std::string>();
+                    double price = data.at("price").get<double>();
+                    const auto& symbol = data.at("symbol").get_ref<const std::string&>();
                     
                     // Apply filtering at processing level
                     if (symbol == "AAPL" || symbol == "GOOGL") {
@@ -205,23 +220,23 @@ int main() {
                 case EventType::ORDER_PLACED:
                     LOG_EVENT("Processing OrderPlaced event");
                     sm.process_event(OrderPlaced{
-                        data["order_id"].get<std::string>(),
-                        data["price"].get<double>(),
-                        data["quantity"].get<int>()
+                        data.at("order_id").get<std::string>(),
+                        data.at("price").get<double>(),
+                        data.at("quantity").get<int>()
                     });
                     break;
                     
                 case EventType::ORDER_FILLED:
                     LOG_EVENT("Processing OrderFilled event");
                     sm.process_event(OrderFilled{
-                        data["order_id"].get<std::string>()
+                        data.at("order_id").get<std::string>()
                     });
                     break;
                     
                 case EventType::ORDER_CANCELLED:
                     LOG_EVENT("Processing OrderCancelled event");
                     sm.process_event(OrderCancelled{
-                        data["order_id"].get<std::string>()
+                        data.at("order_id").get<std::string>()
                     });
                     break;
                     
@@ -236,6 +251,7 @@ int main() {
     // Create and add market data adapter
     EVENT_LOG_INFO("Creating market data adapter");
     auto market_adapter = std::make_shared<MarketDataAdapter>("ws://localhost:8080/market");
+    market_adapter->set_auto_reconnect(true);
     
     // Add adapter to system - the system handles all event routing
     system.add_adapter(market_adapter);
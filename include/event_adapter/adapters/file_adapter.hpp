@@ -5,7 +5,8 @@
 #include <fstream>
 #include <chrono>
 #include <sstream>
-#include <set>
+#include <vector>
+#include <algorithm>
 
 namespace event_adapter::adapters {
 
@@ -30,7 +31,7 @@ protected:
                 }
             } else if (last_write_time_ != fs::file_time_type{}) {
                 last_write_time_ = fs::file_time_type{};
-                emit<DataUpdateEvent>(name(), "file_deleted", path_, std::string{});
+                on_file_deleted();
             }
         } catch (const fs::filesystem_error& e) {
             emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), e.what());
@@ -41,6 +42,10 @@ protected:
         emit<DataUpdateEvent>(name(), "file_modified", path_, std::string{});
     }
     
+    virtual void on_file_deleted() {
+        emit<DataUpdateEvent>(name(), "file_deleted", path_, std::string{});
+    }
+    
 protected:
     std::string path_;
     
@@ -55,8 +60,19 @@ public:
 protected:
     void on_file_changed() override {
         std::string content = read_file_content();
-        emit<DataUpdateEvent>(name(), "content", content, last_content_);
+        // A bumped mtime alone (touch, rewrite of identical data) is not an update,
+        // but only dedup against content read from the file as it currently exists
+        if (has_content_ && content == last_content_) {
+            return;
+        }
+        emit<DataUpdateEvent>(name(), "content", content, std::move(last_content_));
         last_content_ = std::move(content);
+        has_content_ = true;
+    }
+    
+    void on_file_deleted() override {
+        FileWatcherAdapter::on_file_deleted();
+        has_content_ = false;
     }
     
 private:
@@ -72,6 +88,7 @@ private:
     }
     
     std::string last_content_;
+    bool has_content_ = false;
 };
 
 class DirectoryWatcherAdapter : public PollingDataSourceAdapter {
@@ -87,31 +104,34 @@ protected:
                 return;
             }
             
-            std::set<std::string> current_files;
+            // Scratch buffers are members so their capacity survives between polls
+            current_files_.clear();
+            added_.clear();
+            removed_.clear();
+            
+            // Directory entries are unique, so one sort replaces per-name tree inserts
             for (const auto& entry : fs::directory_iterator(path_)) {
-                current_files.insert(entry.path().filename().string());
+                current_files_.push_back(entry.path().filename().string());
             }
+            std::sort(current_files_.begin(), current_files_.end());
             
-            std::vector<std::string> added;
-            std::vector<std::string> removed;
-            
-            std::set_difference(current_files.begin(), current_files.end(),
+            std::set_difference(current_files_.begin(), current_files_.end(),
                               last_files_.begin(), last_files_.end(),
-                              std::back_inserter(added));
+                              std::back_inserter(added_));
             
             std::set_difference(last_files_.begin(), last_files_.end(),
-                              current_files.begin(), current_files.end(),
-                              std::back_inserter(removed));
+                              current_files_.begin(), current_files_.end(),
+                              std::back_inserter(removed_));
             
-            for (const auto& file : added) {
+            for (const auto& file : added_) {
                 emit<DataUpdateEvent>(name(), "file_added", file, std::string{});
             }
             
-            for (const auto& file : removed) {
+            for (const auto& file : removed_) {
                 emit<DataUpdateEvent>(name(), "file_removed", file, std::string{});
             }
             
-            last_files_ = std::move(current_files);
+            last_files_.swap(current_files_);
             
         } catch (const fs::filesystem_error& e) {
             emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), e.what());
@@ -120,7 +140,10 @@ protected:
     
 private:
     std::string path_;
-    std::set<std::string> last_files_;
+    std::vector<std::string> last_files_; // sorted
+    std::vector<std::string> current_files_;
+    std::vector<std::string> added_;
+    std::vector<std::string> removed_;
 };
 
 } // namespace event_adapter::adapters
\ No newline at end of file
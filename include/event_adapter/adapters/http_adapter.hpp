@@ -22,20 +22,31 @@ public:
     
     ~HttpAdapter() {
         disconnect();
+        if (curl_) {
+            curl_easy_cleanup(curl_);
+        }
         curl_global_cleanup();
     }
     
+    // Skip polls whose body matches the previous one instead of re-emitting (and
+    // re-parsing) it. Off by default, so every successful poll emits an update.
+    void set_skip_unchanged(bool enabled) {
+        skip_unchanged_ = enabled;
+    }
+    
 protected:
     void poll() override {
         std::string response = fetch_data();
-        if (!response.empty()) {
-            process_response(response);
+        if (response.empty() || (skip_unchanged_ && response == last_response_)) {
+            return;
         }
+        process_response(response);
+        last_response_ = std::move(response);
     }
     
     virtual void process_response(const std::string& response) {
-        emit<DataUpdateEvent>(name(), "http_response", response, last_response_);
-        last_response_ = response;
+        // poll() replaces the previous payload right after, so hand it to the event
+        emit<DataUpdateEvent>(name(), "http_response", response, std::move(last_response_));
     }
     
 private:
@@ -47,21 +58,25 @@ private:
     std::string fetch_data() {
         std::string response;
         
-        CURL* curl = curl_easy_init();
-        if (curl) {
-            curl_easy_setopt(curl, CURLOPT_URL, url_.c_str());
-            curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, write_callback);
-            curl_easy_setopt(curl, CURLOPT_WRITEDATA, &response);
-            curl_easy_setopt(curl, CURLOPT_TIMEOUT, 10L);
-            
-            CURLcode res = curl_easy_perform(curl);
-            
-            if (res != CURLE_OK) {
-                emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), 
-                                    std::string("HTTP request failed: ") + curl_easy_strerror(res));
+        // Keep one easy handle for the adapter's lifetime so libcurl can reuse
+        // the connection (and its DNS/TLS state) across polls
+        if (!curl_) {
+            curl_ = curl_easy_init();
+            if (!curl_) {
+                return response;
             }
-            
-            curl_easy_cleanup(curl);
+            curl_easy_setopt(curl_, CURLOPT_URL, url_.c_str());
+            curl_easy_setopt(curl_, CURLOPT_WRITEFUNCTION, write_callback);
+            curl_easy_setopt(curl_, CURLOPT_TIMEOUT, 10L);
+        }
+        
+        curl_easy_setopt(curl_, CURLOPT_WRITEDATA, &response);
+        
+        CURLcode res = curl_easy_perform(curl_);
+        
+        if (res != CURLE_OK) {
+            emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), 
+                                std::string("HTTP request failed: ") + curl_easy_strerror(res));
         }
         
         return response;
@@ -69,6 +84,7 @@ private:
     
     std::string url_;
     std::string last_response_;
+    std::atomic<bool> skip_unchanged_{false};
     CURL* curl_;
 };
 
@@ -80,8 +96,8 @@ protected:
     void process_response(const std::string& response) override {
         try {
             json j = json::parse(response);
-            emit<DataUpdateEvent>(name(), "json_data", j, last_json_);
-            last_json_ = j;
+            emit<DataUpdateEvent>(name(), "json_data", j, std::move(last_json_));
+            last_json_ = std::move(j);
         } catch (const json::parse_error& e) {
             emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), 
                                 std::string("JSON parse error: ") + e.what());
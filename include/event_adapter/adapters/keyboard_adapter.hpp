@@ -7,7 +7,7 @@
 #include <atomic>
 #include <thread>
 #include <iostream>
-#include <set>
+#include <bitset>
 
 namespace event_adapter::adapters {
 
@@ -98,6 +98,14 @@ public:
             return;
         }
         
+        // Self-pipe used by disconnect() to wake the input thread out of select()
+        if (pipe(wake_pipe_) != 0) {
+            tcsetattr(STDIN_FILENO, TCSANOW, &old_termios_);
+            set_state(State::Error);
+            emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), "Failed to create wakeup pipe");
+            return;
+        }
+        
         // Make stdin non-blocking
         int flags = fcntl(STDIN_FILENO, F_GETFL, 0);
         fcntl(STDIN_FILENO, F_SETFL, flags | O_NONBLOCK);
@@ -121,10 +129,19 @@ public:
         set_state(State::Disconnecting);
         should_run_ = false;
         
+        char wake = 0;
+        if (write(wake_pipe_[1], &wake, 1) != 1) {
+            EVENT_LOG_WARN("KeyboardAdapter '{}' failed to wake input thread", name());
+        }
+        
         if (input_thread_.joinable()) {
             input_thread_.join();
         }
         
+        close(wake_pipe_[0]);
+        close(wake_pipe_[1]);
+        wake_pipe_[0] = wake_pipe_[1] = -1;
+        
         // Restore terminal settings
         tcsetattr(STDIN_FILENO, TCSANOW, &old_termios_);
         
@@ -145,27 +162,33 @@ public:
     }
     
     void add_key_filter(char key) {
-        filtered_keys_.insert(key);
+        filtered_keys_.set(static_cast<unsigned char>(key));
     }
     
     void clear_key_filters() {
-        filtered_keys_.clear();
+        filtered_keys_.reset();
     }
     
 private:
     void process_input() {
         char buffer[16];
         
+        const int wake_fd = wake_pipe_[0];
+        const int max_fd = std::max(STDIN_FILENO, wake_fd);
+        
         while (should_run_) {
             fd_set fds;
             FD_ZERO(&fds);
             FD_SET(STDIN_FILENO, &fds);
+            FD_SET(wake_fd, &fds);
             
-            timeval timeout;
-            timeout.tv_sec = 0;
-            timeout.tv_usec = 100000; // 100ms
-            
-            if (select(STDIN_FILENO + 1, &fds, nullptr, nullptr, &timeout) > 0) {
+            // Block until a key arrives or disconnect() writes to the wakeup pipe,
+            // rather than waking every 100ms to re-check should_run_
+            if (select(max_fd + 1, &fds, nullptr, nullptr, nullptr) > 0) {
+                if (FD_ISSET(wake_fd, &fds)) {
+                    break;
+                }
+                
                 ssize_t bytes_read = read(STDIN_FILENO, buffer, sizeof(buffer));
                 
                 if (bytes_read > 0) {
@@ -176,6 +199,9 @@ private:
     }
     
     void process_buffer(const char* buffer, ssize_t length) {
+        // Collect echo output for the whole read and flush it once at the end
+        std::string echo;
+        
         for (ssize_t i = 0; i < length; ++i) {
             char ch = buffer[i];
             
@@ -195,25 +221,29 @@ private:
                 emit<SpecialKeyEvent>(SpecialKeyEvent::Tab);
             } else if (ch == '\n' || ch == '\r') {
                 emit<SpecialKeyEvent>(SpecialKeyEvent::Enter);
-                if (echo_enabled_) std::cout << std::endl;
+                if (echo_enabled_) echo += '\n';
             } else if (ch == 127 || ch == 8) {
                 emit<SpecialKeyEvent>(SpecialKeyEvent::Backspace);
-                if (echo_enabled_) std::cout << "\b \b" << std::flush;
+                if (echo_enabled_) echo += "\b \b";
             } else if (ch >= 1 && ch <= 26) {
                 // Ctrl+A through Ctrl+Z
                 emit<KeyPressEvent>(static_cast<char>('a' + ch - 1), true, false, false);
             } else {
                 // Regular character
-                if (mode_ == Mode::Filtered && !filtered_keys_.empty()) {
-                    if (filtered_keys_.find(ch) == filtered_keys_.end()) {
+                if (mode_ == Mode::Filtered && filtered_keys_.any()) {
+                    if (!filtered_keys_.test(static_cast<unsigned char>(ch))) {
                         continue; // Skip non-filtered keys
                     }
                 }
                 
                 emit<KeyPressEvent>(ch, false, false, false);
-                if (echo_enabled_) std::cout << ch << std::flush;
+                if (echo_enabled_) echo += ch;
             }
         }
+        
+        if (!echo.empty()) {
+            std::cout << echo << std::flush;
+        }
     }
     
     void handle_escape_sequence(char seq) {
@@ -254,9 +284,10 @@ private:
     Mode mode_;
     std::atomic<bool> should_run_;
     std::thread input_thread_;
+    int wake_pipe_[2] = {-1, -1};
     termios old_termios_;
     bool echo_enabled_;
-    std::set<char> filtered_keys_;
+    std::bitset<256> filtered_keys_; // one bit per byte value, no per-key allocation
 };
 
 // Convenience factory functions
@@ -5,6 +5,7 @@
 #include <websocketpp/client.hpp>
 #include <websocketpp/config/asio_no_tls_client.hpp>
 #include <nlohmann/json.hpp>
+#include <mutex>
 
 namespace event_adapter::adapters {
 
@@ -15,6 +16,9 @@ public:
     using client = websocketpp::client<websocketpp::config::asio_client>;
     using message_ptr = websocketpp::config::asio_client::message_type::ptr;
     
+    // Floor for the reconnect backoff; a zero delay would never grow and spin the client thread
+    static constexpr std::chrono::milliseconds min_reconnect_delay{100};
+    
     WebSocketAdapter(std::string name, std::string uri) 
         : DataSourceAdapter(std::move(name))
         , uri_(std::move(uri)) {
@@ -41,6 +45,15 @@ public:
         client_.set_fail_handler([this](websocketpp::connection_hdl hdl) {
             on_fail(hdl);
         });
+        
+        // Small, latency-sensitive frames: don't let Nagle hold them back waiting to coalesce
+        client_.set_socket_init_handler([this](websocketpp::connection_hdl, websocketpp::lib::asio::ip::tcp::socket& socket) {
+            websocketpp::lib::asio::error_code ec;
+            socket.set_option(websocketpp::lib::asio::ip::tcp::no_delay(true), ec);
+            if (ec) {
+                EVENT_LOG_WARN("WebSocketAdapter '{}' failed to set TCP_NODELAY: {}", name(), ec.message());
+            }
+        });
     }
     
     ~WebSocketAdapter() {
@@ -50,20 +63,21 @@ public:
     
     void connect() override {
         EVENT_LOG_INFO("WebSocketAdapter '{}' connecting to: {}", name(), uri_);
-        set_state(State::Connecting);
+        should_reconnect_ = auto_reconnect_;
+        // Snapshot the settings; the client thread only ever reads these copies
+        active_initial_delay_ = initial_reconnect_delay_;
+        active_max_delay_ = max_reconnect_delay_;
+        reconnect_delay_ = active_initial_delay_;
         
-        websocketpp::lib::error_code ec;
-        client::connection_ptr con = client_.get_connection(uri_, ec);
-        
-        if (ec) {
-            EVENT_LOG_ERROR("WebSocketAdapter '{}' connection error: {}", name(), ec.message());
-            set_state(State::Error);
-            emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), ec.message());
+        if (!open_connection()) {
+            should_reconnect_ = false;
             return;
         }
         
-        connection_ = con;
-        client_.connect(con);
+        // Keep run() alive across dropped connections so reconnects reuse this thread
+        if (auto_reconnect_) {
+            client_.start_perpetual();
+        }
         
         client_thread_ = std::thread([this]() {
             EVENT_LOG_DEBUG("WebSocketAdapter '{}' client thread started", name());
@@ -75,10 +89,12 @@ public:
     void disconnect() override {
         EVENT_LOG_INFO("WebSocketAdapter '{}' disconnecting", name());
         set_state(State::Disconnecting);
+        should_reconnect_ = false;
+        client_.stop_perpetual();
         
-        if (connection_) {
+        if (auto con = current_connection()) {
             websocketpp::lib::error_code ec;
-            client_.close(connection_->get_handle(), websocketpp::close::status::normal, "Closing", ec);
+            client_.close(con->get_handle(), websocketpp::close::status::normal, "Closing", ec);
             if (ec) {
                 EVENT_LOG_WARN("WebSocketAdapter '{}' close error: {}", name(), ec.message());
             }
@@ -97,19 +113,19 @@ public:
         return state() == State::Connected;
     }
     
+    // Re-open the connection after it closes or fails, waiting initial_delay (at least
+    // min_reconnect_delay) before the first attempt and doubling up to max_delay;
+    // takes effect on the next connect()
+    void set_auto_reconnect(bool enabled,
+                            std::chrono::milliseconds initial_delay = std::chrono::seconds(1),
+                            std::chrono::milliseconds max_delay = std::chrono::seconds(30)) {
+        auto_reconnect_ = enabled;
+        initial_reconnect_delay_ = std::max(initial_delay, min_reconnect_delay);
+        max_reconnect_delay_ = std::max(initial_reconnect_delay_, max_delay);
+    }
+    
     void send_message(const std::string& message) {
-        if (connection_ && is_connected()) {
-            EVENT_LOG_TRACE("WebSocketAdapter '{}' sending message: {} bytes", name(), message.size());
-            websocketpp::lib::error_code ec;
-            client_.send(connection_->get_handle(), message, websocketpp::frame::opcode::text, ec);
-            
-            if (ec) {
-                EVENT_LOG_ERROR("WebSocketAdapter '{}' send error: {}", name(), ec.message());
-                emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), ec.message());
-            }
-        } else {
-            EVENT_LOG_WARN("WebSocketAdapter '{}' cannot send message - not connected", name());
-        }
+        send_frame(message.data(), message.size(), websocketpp::frame::opcode::text);
     }
     
     void send_json(const json& data) {
@@ -117,6 +133,13 @@ public:
         send_message(data.dump());
     }
     
+    // Same document as send_json, encoded as MessagePack in a binary frame
+    void send_msgpack(const json& data) {
+        EVENT_LOG_TRACE("WebSocketAdapter '{}' sending MessagePack message", name());
+        auto payload = json::to_msgpack(data);
+        send_frame(payload.data(), payload.size(), websocketpp::frame::opcode::binary);
+    }
+    
 protected:
     virtual void on_json_message(const json& message) {
         emit<DataUpdateEvent>("websocket", "message", message, json{});
@@ -133,9 +156,84 @@ protected:
         }
     }
     
+    // Binary frames carry MessagePack, which decodes to the same json document as text frames
+    virtual void on_binary_message(const std::string& message) {
+        EVENT_LOG_TRACE("WebSocketAdapter '{}' received binary message: {} bytes", name(), message.size());
+        try {
+            json j = json::from_msgpack(message);
+            on_json_message(j);
+        } catch (const json::parse_error& e) {
+            EVENT_LOG_WARN("WebSocketAdapter '{}' MessagePack decode error: {}", name(), e.what());
+            emit<DataUpdateEvent>("websocket", "raw_message", message, std::string{});
+        }
+    }
+    
 private:
+    void send_frame(const void* payload, size_t size, websocketpp::frame::opcode::value opcode) {
+        auto con = current_connection();
+        if (con && is_connected()) {
+            EVENT_LOG_TRACE("WebSocketAdapter '{}' sending message: {} bytes", name(), size);
+            // We already hold the connection; going through client_.send() would
+            // re-resolve it from the handle via a weak_ptr lock on every frame
+            websocketpp::lib::error_code ec = con->send(payload, size, opcode);
+            
+            if (ec) {
+                EVENT_LOG_ERROR("WebSocketAdapter '{}' send error: {}", name(), ec.message());
+                emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), ec.message());
+            }
+        } else {
+            EVENT_LOG_WARN("WebSocketAdapter '{}' cannot send message - not connected", name());
+        }
+    }
+    
+    bool open_connection() {
+        set_state(State::Connecting);
+        
+        websocketpp::lib::error_code ec;
+        client::connection_ptr con = client_.get_connection(uri_, ec);
+        
+        if (ec) {
+            EVENT_LOG_ERROR("WebSocketAdapter '{}' connection error: {}", name(), ec.message());
+            set_state(State::Error);
+            emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), ec.message());
+            return false;
+        }
+        
+        {
+            std::lock_guard<std::mutex> lock(connection_mutex_);
+            connection_ = con;
+        }
+        client_.connect(con);
+        return true;
+    }
+    
+    client::connection_ptr current_connection() const {
+        std::lock_guard<std::mutex> lock(connection_mutex_);
+        return connection_;
+    }
+    
+    // Runs on the client thread, from the close/fail handlers
+    void schedule_reconnect() {
+        if (!should_reconnect_) {
+            return;
+        }
+        
+        auto delay = reconnect_delay_;
+        reconnect_delay_ = std::min(reconnect_delay_ * 2, active_max_delay_);
+        EVENT_LOG_INFO("WebSocketAdapter '{}' reconnecting in {}ms", name(), delay.count());
+        
+        client_.set_timer(delay.count(), [this](const websocketpp::lib::error_code& ec) {
+            // A failed get_connection() fires neither the close nor the fail handler,
+            // so re-arm here or the perpetual loop would sit idle in State::Error
+            if (!ec && should_reconnect_ && !open_connection()) {
+                schedule_reconnect();
+            }
+        });
+    }
+    
     void on_open(websocketpp::connection_hdl hdl) {
         EVENT_LOG_INFO("WebSocketAdapter '{}' connected successfully", name());
+        reconnect_delay_ = active_initial_delay_;
         set_state(State::Connected);
         emit<ConnectionEvent>(ConnectionEvent::Type::Connected, name(), uri_);
     }
@@ -144,22 +242,40 @@ private:
         EVENT_LOG_INFO("WebSocketAdapter '{}' connection closed", name());
         set_state(State::Disconnected);
         emit<ConnectionEvent>(ConnectionEvent::Type::Disconnected, name(), uri_);
+        schedule_reconnect();
     }
     
     void on_message(websocketpp::connection_hdl hdl, message_ptr msg) {
-        on_text_message(msg->get_payload());
+        if (msg->get_opcode() == websocketpp::frame::opcode::binary) {
+            on_binary_message(msg->get_payload());
+        } else {
+            on_text_message(msg->get_payload());
+        }
     }
     
     void on_fail(websocketpp::connection_hdl hdl) {
         EVENT_LOG_ERROR("WebSocketAdapter '{}' connection failed", name());
         set_state(State::Error);
         emit<ConnectionEvent>(ConnectionEvent::Type::Error, name(), "Connection failed");
+        schedule_reconnect();
     }
     
     std::string uri_;
     client client_;
     client::connection_ptr connection_;
+    mutable std::mutex connection_mutex_;
     std::thread client_thread_;
+    
+    // Written by set_auto_reconnect(), read only by connect()
+    bool auto_reconnect_ = false;
+    std::chrono::milliseconds initial_reconnect_delay_{1000};
+    std::chrono::milliseconds max_reconnect_delay_{30000};
+    
+    // Copied in connect() before the client thread starts, then owned by that thread
+    std::atomic<bool> should_reconnect_{false};
+    std::chrono::milliseconds active_initial_delay_{1000};
+    std::chrono::milliseconds active_max_delay_{30000};
+    std::chrono::milliseconds reconnect_delay_{1000};
 };
 
 } // namespace event_adapter::adapters
\ No newline at end of file
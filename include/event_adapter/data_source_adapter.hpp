@@ -9,6 +9,7 @@
 #include <atomic>
 #include <thread>
 #include <algorithm>
+#include <mutex>
 
 namespace event_adapter {
 
@@ -57,28 +58,38 @@ public:
     State state() const { return state_.load(); }
     
     void subscribe(std::shared_ptr<EventHandler> handler) {
-        handlers_.push_back(handler);
-        EVENT_LOG_DEBUG("Handler subscribed to adapter '{}', total handlers: {}", name_, handlers_.size());
+        [[maybe_unused]] auto count = update_handlers([&](HandlerList& handlers) {
+            handlers.push_back(std::move(handler));
+        });
+        EVENT_LOG_DEBUG("Handler subscribed to adapter '{}', total handlers: {}", name_, count);
     }
     
     void subscribe(EventHandler::Callback callback) {
-        handlers_.push_back(std::make_shared<FunctionalEventHandler>(std::move(callback)));
-        EVENT_LOG_DEBUG("Callback subscribed to adapter '{}', total handlers: {}", name_, handlers_.size());
+        [[maybe_unused]] auto count = update_handlers([&](HandlerList& handlers) {
+            handlers.push_back(std::make_shared<FunctionalEventHandler>(std::move(callback)));
+        });
+        EVENT_LOG_DEBUG("Callback subscribed to adapter '{}', total handlers: {}", name_, count);
     }
     
     void unsubscribe(std::shared_ptr<EventHandler> handler) {
-        auto prev_size = handlers_.size();
-        handlers_.erase(
-            std::remove(handlers_.begin(), handlers_.end(), handler),
-            handlers_.end()
-        );
-        EVENT_LOG_DEBUG("Handler unsubscribed from adapter '{}', handlers: {} -> {}", name_, prev_size, handlers_.size());
+        size_t prev_size = 0;
+        [[maybe_unused]] auto count = update_handlers([&](HandlerList& handlers) {
+            prev_size = handlers.size();
+            handlers.erase(
+                std::remove(handlers.begin(), handlers.end(), handler),
+                handlers.end()
+            );
+        });
+        EVENT_LOG_DEBUG("Handler unsubscribed from adapter '{}', handlers: {} -> {}", name_, prev_size, count);
     }
     
 protected:
     void emit_event(EventPtr event) {
         EVENT_LOG_TRACE("Adapter '{}' emitting event of type: {}", name_, event->type().name());
-        for (const auto& handler : handlers_) {
+        // Snapshot the current list (a short hashed lock plus one refcount, no vector
+        // copy); (un)subscribe publishes a new list instead of mutating this one
+        auto handlers = std::atomic_load(&handlers_);
+        for (const auto& handler : *handlers) {
             if (handler) {
                 try {
                     handler->handle(event);
@@ -101,9 +112,24 @@ protected:
     }
     
 private:
+    using HandlerList = std::vector<std::shared_ptr<EventHandler>>;
+    
+    // Copy-on-write: writers copy the list, modify it, and publish it with atomic_store,
+    // so emit_event only takes the shared_ptr snapshot, never handlers_mutex_ or a copy
+    template<typename Mutator>
+    size_t update_handlers(Mutator mutate) {
+        std::lock_guard<std::mutex> lock(handlers_mutex_);
+        auto updated = std::make_shared<HandlerList>(*std::atomic_load(&handlers_));
+        mutate(*updated);
+        auto count = updated->size();
+        std::atomic_store(&handlers_, std::shared_ptr<const HandlerList>(std::move(updated)));
+        return count;
+    }
+    
     std::string name_;
     std::atomic<State> state_;
-    std::vector<std::shared_ptr<EventHandler>> handlers_;
+    std::shared_ptr<const HandlerList> handlers_ = std::make_shared<HandlerList>();
+    std::mutex handlers_mutex_; // serializes writers only
 };
 
 template<typename SourceType>
@@ -148,13 +174,22 @@ protected:
     void start_polling() {
         polling_thread_ = std::thread([this]() {
             EVENT_LOG_DEBUG("Polling thread started for adapter '{}'", name());
+            auto next_poll = std::chrono::steady_clock::now();
             while (should_poll_.load()) {
                 try {
                     poll();
                 } catch (const std::exception& e) {
                     EVENT_LOG_ERROR("Polling error in adapter '{}': {}", name(), e.what());
                 }
-                std::this_thread::sleep_for(polling_interval_);
+                
+                // Fixed-rate schedule: poll() time doesn't stretch the interval, and
+                // an overrun skips missed slots instead of polling back-to-back
+                next_poll += polling_interval_;
+                auto now = std::chrono::steady_clock::now();
+                if (next_poll < now) {
+                    next_poll = now + polling_interval_;
+                }
+                std::this_thread::sleep_until(next_poll);
             }
             EVENT_LOG_DEBUG("Polling thread stopped for adapter '{}'", name());
         });
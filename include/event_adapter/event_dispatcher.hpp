@@ -20,6 +20,7 @@ template<typename StateMachine>
 class EventDispatcher {
 public:
     using EventProcessor = std::function<void(EventPtr, StateMachine&)>;
+    using DropPredicate = std::function<bool(const EventPtr&)>;
     
     explicit EventDispatcher(StateMachine& sm) : state_machine_(sm), running_(false) {
         EVENT_LOG_DEBUG("EventDispatcher created");
@@ -34,7 +35,9 @@ public:
     void register_event_processor(std::function<void(const EventType&, StateMachine&)> processor) {
         EVENT_LOG_DEBUG("Registering event processor for type: {}", typeid(EventType).name());
         processors_[std::type_index(typeid(EventType))] = [processor](EventPtr event, StateMachine& sm) {
-            if (auto typed_event = std::dynamic_pointer_cast<TypedEvent<EventType>>(event)) {
+            // processors_ is keyed by type, so only the cast itself is left to check;
+            // a raw-pointer cast skips the shared_ptr refcount round-trip
+            if (auto typed_event = dynamic_cast<const TypedEvent<EventType>*>(event.get())) {
                 processor(typed_event->data(), sm);
             }
         };
@@ -56,12 +59,36 @@ public:
     
     void dispatch(EventPtr event) {
         EVENT_LOG_TRACE("Dispatching event of type: {}", event->type().name());
+        bool was_empty = false;
+        size_t max_size = 0;
+        size_t dropped = 0;
+        bool rejected = false;
         {
             std::lock_guard<std::mutex> lock(queue_mutex_);
-            event_queue_.push(event);
-            EVENT_LOG_TRACE("Event queued, queue size: {}", event_queue_.size());
+            max_size = max_queue_size_;
+            if (max_size != 0 && pending_events() >= max_size &&
+                (!droppable_ || droppable_(event))) {
+                // Shed load rather than let a stalled state machine grow the queue without bound
+                dropped = dropped_events_.fetch_add(1, std::memory_order_relaxed);
+                rejected = true;
+            } else {
+                was_empty = event_queue_.empty();
+                event_queue_.push(std::move(event));
+                EVENT_LOG_TRACE("Event queued, queue size: {}", event_queue_.size());
+            }
+        }
+        if (rejected) {
+            // Log outside the lock so sink I/O never stalls producers or the processor
+            if (dropped % 1000 == 0) {
+                EVENT_LOG_WARN("Event queue full ({} events), dropping {}; {} dropped so far",
+                               max_size, event->type().name(), dropped + 1);
+            }
+            return;
+        }
+        // The processor only sleeps on an empty queue, so skip the wakeup otherwise
+        if (was_empty) {
+            queue_cv_.notify_one();
         }
-        queue_cv_.notify_one();
     }
     
     void start() {
@@ -88,32 +115,59 @@ public:
         EVENT_LOG_INFO("EventDispatcher stopped");
     }
     
+    // Events not yet handed to a processor, including the rest of the batch being drained
     size_t queue_size() const {
         std::lock_guard<std::mutex> lock(queue_mutex_);
-        return event_queue_.size();
+        return pending_events();
+    }
+    
+    // Bound queue_size(); 0 = unbounded. While the queue is full, dispatch() drops new
+    // events that `droppable` accepts and still queues the rest, so events the state
+    // machine must not miss can go over the bound. Without a predicate every event is
+    // droppable, including those. The predicate runs under the queue lock, so keep it
+    // cheap and don't dispatch() from it.
+    void set_max_queue_size(size_t max_size, DropPredicate droppable = nullptr) {
+        std::lock_guard<std::mutex> lock(queue_mutex_);
+        max_queue_size_ = max_size;
+        droppable_ = std::move(droppable);
+    }
+    
+    size_t dropped_events() const {
+        return dropped_events_.load(std::memory_order_relaxed);
     }
     
 private:
     void process_events() {
         EVENT_LOG_DEBUG("Event processing thread started");
-        while (running_) {
-            std::unique_lock<std::mutex> lock(queue_mutex_);
-            queue_cv_.wait(lock, [this]() { return !event_queue_.empty() || !running_; });
+        std::queue<EventPtr> batch;
+        while (true) {
+            {
+                std::unique_lock<std::mutex> lock(queue_mutex_);
+                queue_cv_.wait(lock, [this]() { return !event_queue_.empty() || !running_; });
+                if (event_queue_.empty()) {
+                    break;
+                }
+                // Take everything queued so far in one lock acquisition
+                batch.swap(event_queue_);
+                in_flight_.store(batch.size(), std::memory_order_relaxed);
+            }
             
-            while (!event_queue_.empty()) {
-                auto event = event_queue_.front();
-                event_queue_.pop();
-                EVENT_LOG_TRACE("Processing event from queue, remaining: {}", event_queue_.size());
-                lock.unlock();
-                
-                process_event(event);
-                
-                lock.lock();
+            EVENT_LOG_TRACE("Processing batch of {} events", batch.size());
+            while (!batch.empty()) {
+                EventPtr event = std::move(batch.front());
+                batch.pop();
+                in_flight_.fetch_sub(1, std::memory_order_relaxed);
+                process_event(std::move(event));
             }
         }
         EVENT_LOG_DEBUG("Event processing thread exiting");
     }
     
+    // Caller holds queue_mutex_
+    size_t pending_events() const {
+        return event_queue_.size() + in_flight_.load(std::memory_order_relaxed);
+    }
+    
     void process_event(EventPtr event) {
         auto it = processors_.find(event->type());
         if (it != processors_.end()) {
@@ -134,6 +188,11 @@ private:
     mutable std::mutex queue_mutex_;
     std::condition_variable queue_cv_;
     std::queue<EventPtr> event_queue_;
+    // Drained batch events not yet processed; decremented without taking queue_mutex_
+    std::atomic<size_t> in_flight_{0};
+    size_t max_queue_size_ = 0;
+    DropPredicate droppable_;
+    std::atomic<size_t> dropped_events_{0};
     std::atomic<bool> running_;
     std::thread processor_thread_;
 };
@@ -54,7 +54,11 @@ public:
     explicit TypedPredicateFilter(Predicate predicate) : predicate_(std::move(predicate)) {}
     
     bool passes(EventPtr event) const override {
-        if (auto typed_event = std::dynamic_pointer_cast<TypedEvent<T>>(event)) {
+        // Reject other event types on the type_index before paying for the RTTI cast
+        if (event->type() != std::type_index(typeid(T))) {
+            return false;
+        }
+        if (auto typed_event = dynamic_cast<const TypedEvent<T>*>(event.get())) {
             return predicate_(typed_event->data());
         }
         return false;
@@ -116,7 +120,10 @@ public:
     explicit TypedEventTransformer(TransformFunc func) : transform_func_(std::move(func)) {}
     
     EventPtr transform(EventPtr event) override {
-        if (auto typed_event = std::dynamic_pointer_cast<TypedEvent<From>>(event)) {
+        if (event->type() != std::type_index(typeid(From))) {
+            return event;
+        }
+        if (auto typed_event = dynamic_cast<const TypedEvent<From>*>(event.get())) {
             return make_event<To>(transform_func_(typed_event->data()));
         }
         return event;
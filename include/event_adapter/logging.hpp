@@ -1,6 +1,7 @@
 #pragma once
 
 #include <spdlog/spdlog.h>
+#include <spdlog/async.h>
 #include <spdlog/sinks/stdout_color_sinks.h>
 #include <spdlog/sinks/rotating_file_sink.h>
 #include <memory>
@@ -13,7 +14,10 @@ public:
     static void initialize(const std::string& name = "event_adapter", 
                          spdlog::level::level_enum level = spdlog::level::info,
                          bool console = true,
-                         const std::string& file_path = "") {
+                         const std::string& file_path = "",
+                         bool async = false,
+                         size_t async_queue_size = 8192,
+                         size_t async_threads = 1) {
         std::vector<spdlog::sink_ptr> sinks;
         
         if (console) {
@@ -31,7 +35,16 @@ public:
             sinks.push_back(file_sink);
         }
         
-        auto logger = std::make_shared<spdlog::logger>(name, sinks.begin(), sinks.end());
+        std::shared_ptr<spdlog::logger> logger;
+        if (async) {
+            // Callers only enqueue; the pool's writer threads format and do the sink I/O.
+            // A full queue drops the oldest record instead of stalling adapter threads.
+            logger = std::make_shared<spdlog::async_logger>(name, sinks.begin(), sinks.end(),
+                                                            async_pool(async_queue_size, async_threads),
+                                                            spdlog::async_overflow_policy::overrun_oldest);
+        } else {
+            logger = std::make_shared<spdlog::logger>(name, sinks.begin(), sinks.end());
+        }
         logger->set_level(level);
         logger->flush_on(spdlog::level::warn);
         
@@ -65,6 +78,30 @@ public:
     
     static void shutdown() {
         spdlog::shutdown();
+        // Joins the writer threads once they have drained the queued records
+        owned_pool().reset();
+    }
+
+private:
+    using ThreadPoolPtr = std::shared_ptr<spdlog::details::thread_pool>;
+
+    // Async loggers only hold a weak_ptr to their pool, so replacing spdlog's global
+    // pool would kill every async logger created earlier (including clones made by
+    // get()). Reuse an existing pool; the size arguments only apply to a new one.
+    static ThreadPoolPtr async_pool(size_t queue_size, size_t threads) {
+        if (auto pool = spdlog::thread_pool()) {
+            return pool;
+        }
+        auto& pool = owned_pool();
+        if (!pool) {
+            pool = std::make_shared<spdlog::details::thread_pool>(queue_size, threads);
+        }
+        return pool;
+    }
+
+    static ThreadPoolPtr& owned_pool() {
+        static ThreadPoolPtr pool;
+        return pool;
     }
 };
 
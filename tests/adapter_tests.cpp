@@ -0,0 +1,169 @@
+#include <gtest/gtest.h>
+#include <event_adapter/event.hpp>
+#include <event_adapter/data_source_adapter.hpp>
+#include <chrono>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#ifdef EVENT_ADAPTER_HAS_WEBSOCKET
+#include <event_adapter/adapters/websocket_adapter.hpp>
+#include <netinet/in.h>
+#include <sys/socket.h>
+#include <unistd.h>
+#endif
+
+using namespace event_adapter;
+
+namespace {
+
+// Counts ConnectionEvents of one type emitted by an adapter
+class ConnectionEventCounter {
+public:
+    ConnectionEventCounter(DataSourceAdapter& adapter, ConnectionEvent::Type type) : type_(type) {
+        adapter.subscribe([this](EventPtr event) {
+            auto connection = std::dynamic_pointer_cast<TypedEvent<ConnectionEvent>>(event);
+            if (connection && connection->data().type == type_) {
+                {
+                    std::lock_guard<std::mutex> lock(mutex_);
+                    ++count_;
+                }
+                cv_.notify_all();
+            }
+        });
+    }
+
+    size_t count() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return count_;
+    }
+
+    bool wait_for(size_t count, std::chrono::milliseconds timeout) {
+        std::unique_lock<std::mutex> lock(mutex_);
+        return cv_.wait_for(lock, timeout, [&]() { return count_ >= count; });
+    }
+
+private:
+    ConnectionEvent::Type type_;
+    std::mutex mutex_;
+    std::condition_variable cv_;
+    size_t count_ = 0;
+};
+
+} // namespace
+
+#ifdef EVENT_ADAPTER_HAS_WEBSOCKET
+
+namespace {
+
+// A loopback port with nothing listening on it, so connects are refused
+int unused_local_port() {
+    int fd = ::socket(AF_INET, SOCK_STREAM, 0);
+    sockaddr_in addr{};
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    addr.sin_port = 0;
+    ::bind(fd, reinterpret_cast<sockaddr*>(&addr), sizeof(addr));
+    socklen_t len = sizeof(addr);
+    ::getsockname(fd, reinterpret_cast<sockaddr*>(&addr), &len);
+    ::close(fd);
+    return ntohs(addr.sin_port);
+}
+
+} // namespace
+
+TEST(WebSocketAdapterTest, RetriesRefusedConnectionUntilDisconnect) {
+    adapters::WebSocketAdapter adapter("ws", "ws://127.0.0.1:" + std::to_string(unused_local_port()));
+    ConnectionEventCounter failures(adapter, ConnectionEvent::Type::Error);
+    adapter.set_auto_reconnect(true, std::chrono::milliseconds(100), std::chrono::milliseconds(200));
+
+    adapter.connect();
+    // The first attempt fails, then at least two timer-driven retries fail as well
+    ASSERT_TRUE(failures.wait_for(3, std::chrono::seconds(5)));
+
+    adapter.disconnect();
+    EXPECT_EQ(adapter.state(), DataSourceAdapter::State::Disconnected);
+
+    size_t after_disconnect = failures.count();
+    std::this_thread::sleep_for(std::chrono::milliseconds(600));
+    EXPECT_EQ(failures.count(), after_disconnect);
+}
+
+TEST(WebSocketAdapterTest, ClampsZeroReconnectDelay) {
+    adapters::WebSocketAdapter adapter("ws", "ws://127.0.0.1:" + std::to_string(unused_local_port()));
+    ConnectionEventCounter failures(adapter, ConnectionEvent::Type::Error);
+    adapter.set_auto_reconnect(true, std::chrono::milliseconds(0), std::chrono::milliseconds(0));
+
+    adapter.connect();
+    std::this_thread::sleep_for(std::chrono::milliseconds(350));
+    adapter.disconnect();
+
+    // With a 0ms delay this would be a hot loop; the floor allows a handful of attempts
+    size_t max_attempts = 350 / adapters::WebSocketAdapter::min_reconnect_delay.count() + 2;
+    EXPECT_GE(failures.count(), 1u);
+    EXPECT_LE(failures.count(), max_attempts);
+}
+
+namespace {
+
+// Feeds frames straight into the message handlers, no server needed
+class RecordingWebSocketAdapter : public adapters::WebSocketAdapter {
+public:
+    using WebSocketAdapter::WebSocketAdapter;
+
+    void receive_binary(const std::string& payload) {
+        on_binary_message(payload);
+    }
+
+    std::vector<nlohmann::json> messages;
+
+protected:
+    void on_json_message(const nlohmann::json& message) override {
+        messages.push_back(message);
+    }
+};
+
+std::string to_frame(const std::vector<std::uint8_t>& bytes) {
+    return std::string(bytes.begin(), bytes.end());
+}
+
+} // namespace
+
+TEST(WebSocketAdapterTest, DecodesMessagePackBinaryFrames) {
+    RecordingWebSocketAdapter adapter("ws", "ws://127.0.0.1:1");
+    nlohmann::json update = {
+        {"type", "price_update"},
+        {"symbol", "AAPL"},
+        {"price", 150.25},
+        {"quantity", 100}
+    };
+
+    adapter.receive_binary(to_frame(nlohmann::json::to_msgpack(update)));
+
+    ASSERT_EQ(adapter.messages.size(), 1u);
+    EXPECT_EQ(adapter.messages[0], update);
+}
+
+TEST(WebSocketAdapterTest, ReportsCorruptBinaryFramesAsRawMessages) {
+    RecordingWebSocketAdapter adapter("ws", "ws://127.0.0.1:1");
+    std::vector<std::string> raw_messages;
+    adapter.subscribe([&](EventPtr event) {
+        auto update = std::dynamic_pointer_cast<TypedEvent<DataUpdateEvent>>(event);
+        if (update && update->data().key == "raw_message") {
+            raw_messages.push_back(std::any_cast<std::string>(update->data().value));
+        }
+    });
+
+    auto truncated = to_frame(nlohmann::json::to_msgpack({{"type", "market_open"}}));
+    truncated.pop_back();
+    const std::string reserved_byte("\xc1", 1);
+
+    adapter.receive_binary(truncated);
+    adapter.receive_binary(reserved_byte);
+
+    EXPECT_TRUE(adapter.messages.empty());
+    EXPECT_EQ(raw_messages, (std::vector<std::string>{truncated, reserved_byte}));
+}
+
+#endif // EVENT_ADAPTER_HAS_WEBSOCKET
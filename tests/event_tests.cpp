@@ -0,0 +1,161 @@
+#include <gtest/gtest.h>
+#include <event_adapter/event.hpp>
+#include <event_adapter/event_dispatcher.hpp>
+#include <chrono>
+#include <condition_variable>
+#include <future>
+#include <mutex>
+#include <vector>
+
+using namespace event_adapter;
+
+namespace {
+
+struct Tick {
+    int value;
+};
+
+struct NullStateMachine {
+    template<typename Event>
+    void process_event(const Event&) {}
+};
+
+using Dispatcher = EventDispatcher<NullStateMachine>;
+
+// Collects processed tick values from the dispatcher thread
+class TickRecorder {
+public:
+    void record(int value) {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            values_.push_back(value);
+        }
+        cv_.notify_all();
+    }
+
+    std::vector<int> wait_for(size_t count) {
+        std::unique_lock<std::mutex> lock(mutex_);
+        cv_.wait_for(lock, std::chrono::seconds(5), [&]() { return values_.size() >= count; });
+        return values_;
+    }
+
+private:
+    std::mutex mutex_;
+    std::condition_variable cv_;
+    std::vector<int> values_;
+};
+
+} // namespace
+
+TEST(EventDispatcherTest, ProcessesEventsInDispatchOrder) {
+    NullStateMachine sm;
+    Dispatcher dispatcher(sm);
+    TickRecorder recorder;
+    dispatcher.register_event_processor<Tick>([&](const Tick& tick, NullStateMachine&) {
+        recorder.record(tick.value);
+    });
+
+    dispatcher.start();
+    for (int i = 0; i < 100; ++i) {
+        dispatcher.dispatch(make_event<Tick>(i));
+    }
+
+    auto values = recorder.wait_for(100);
+    dispatcher.stop();
+
+    ASSERT_EQ(values.size(), 100u);
+    for (int i = 0; i < 100; ++i) {
+        EXPECT_EQ(values[i], i);
+    }
+}
+
+TEST(EventDispatcherTest, QueueSizeCountsUnprocessedBatchEvents) {
+    NullStateMachine sm;
+    Dispatcher dispatcher(sm);
+    TickRecorder recorder;
+    std::promise<void> entered;
+    std::promise<void> release;
+    auto released = release.get_future().share();
+    dispatcher.register_event_processor<Tick>([&](const Tick& tick, NullStateMachine&) {
+        if (tick.value == 0) {
+            entered.set_value();
+            released.wait();
+        }
+        recorder.record(tick.value);
+    });
+
+    // Queued before start(), so the processor drains all five as one batch
+    for (int i = 0; i < 5; ++i) {
+        dispatcher.dispatch(make_event<Tick>(i));
+    }
+    EXPECT_EQ(dispatcher.queue_size(), 5u);
+
+    dispatcher.start();
+    entered.get_future().wait();
+    EXPECT_EQ(dispatcher.queue_size(), 4u);
+
+    release.set_value();
+    EXPECT_EQ(recorder.wait_for(5).size(), 5u);
+    EXPECT_EQ(dispatcher.queue_size(), 0u);
+    dispatcher.stop();
+}
+
+TEST(EventDispatcherTest, BoundedQueueDropsNewestAndKeepsOrder) {
+    NullStateMachine sm;
+    Dispatcher dispatcher(sm);
+    TickRecorder recorder;
+    dispatcher.register_event_processor<Tick>([&](const Tick& tick, NullStateMachine&) {
+        recorder.record(tick.value);
+    });
+    dispatcher.set_max_queue_size(3);
+
+    for (int i = 0; i < 10; ++i) {
+        dispatcher.dispatch(make_event<Tick>(i));
+    }
+    EXPECT_EQ(dispatcher.queue_size(), 3u);
+    EXPECT_EQ(dispatcher.dropped_events(), 7u);
+
+    dispatcher.start();
+    auto values = recorder.wait_for(3);
+    dispatcher.stop();
+
+    EXPECT_EQ(values, (std::vector<int>{0, 1, 2}));
+}
+
+TEST(EventDispatcherTest, BoundedQueueOnlyDropsDroppableEvents) {
+    NullStateMachine sm;
+    Dispatcher dispatcher(sm);
+    TickRecorder recorder;
+    dispatcher.register_event_processor<Tick>([&](const Tick& tick, NullStateMachine&) {
+        recorder.record(tick.value);
+    });
+    // Odd ticks stand in for control events that must always reach the state machine
+    dispatcher.set_max_queue_size(2, [](const EventPtr& event) {
+        auto tick = std::dynamic_pointer_cast<TypedEvent<Tick>>(event);
+        return tick && tick->data().value % 2 == 0;
+    });
+
+    for (int i = 0; i < 8; ++i) {
+        dispatcher.dispatch(make_event<Tick>(i));
+    }
+    // 0 and 1 fill the queue; 3, 5 and 7 go over the bound, 2, 4 and 6 are dropped
+    EXPECT_EQ(dispatcher.queue_size(), 5u);
+    EXPECT_EQ(dispatcher.dropped_events(), 3u);
+
+    dispatcher.start();
+    auto values = recorder.wait_for(5);
+    dispatcher.stop();
+
+    EXPECT_EQ(values, (std::vector<int>{0, 1, 3, 5, 7}));
+}
+
+TEST(EventDispatcherTest, UnboundedByDefault) {
+    NullStateMachine sm;
+    Dispatcher dispatcher(sm);
+
+    for (int i = 0; i < 1000; ++i) {
+        dispatcher.dispatch(make_event<Tick>(i));
+    }
+    EXPECT_EQ(dispatcher.queue_size(), 1000u);
+    EXPECT_EQ(dispatcher.dropped_events(), 0u);
+}